@@ -1,17 +1,26 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field
 from typing import List, Literal
-from io import BytesIO
-import PyPDF2
+from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import orjson
+import pymupdf
 import logging
 
-from services.analyzer import analyze_resume, suggest_growth_path, optimize_resume, generate_cover_letter_text
+from services.analyzer import analyze_resume, analyze_resumes, suggest_growth_path, optimize_resume, generate_cover_letter_text, content_hash
 from services.pdf_generator import generate_resume_pdf, generate_resume_bytes
 
 
-app = FastAPI(title="AI Resume Assistant", version="0.2.0")
+class OrjsonResponse(JSONResponse):
+    # orjson serializes in native code; FastAPI's own ORJSONResponse is deprecated
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+app = FastAPI(title="AI Resume Assistant", version="0.2.0", default_response_class=OrjsonResponse)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -27,10 +36,15 @@ app.add_middleware(
 )
 
 MAX_PDF_SIZE_MB = 10
+MAX_BATCH_RESUMES = 100
+
+# PDF parsing is CPU-bound and PyMuPDF is not thread-safe: run it off the event
+# loop on a single dedicated thread (scale out with more uvicorn workers)
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-extract")
 
 
 def json_response(success: bool, message: str = "", data: dict | None = None):
-    return JSONResponse({"success": success, "message": message, "data": data or {}}, status_code=200 if success else 400)
+    return OrjsonResponse({"success": success, "message": message, "data": data or {}}, status_code=200 if success else 400)
 
 
 class AnalyzeRequest(BaseModel):
@@ -38,6 +52,11 @@ class AnalyzeRequest(BaseModel):
     job_desc: str
 
 
+class AnalyzeBatchRequest(BaseModel):
+    resumes: List[str] = Field(..., max_length=MAX_BATCH_RESUMES)
+    job_desc: str
+
+
 class SuggestRequest(BaseModel):
     resume: str
 
@@ -62,6 +81,22 @@ class UserPrefRequest(BaseModel):
     theme: Literal["light", "dark"]
 
 
+def _extract_pdf_text(file_bytes: bytes) -> str:
+    doc = pymupdf.open(stream=file_bytes, filetype="pdf")
+    buf = StringIO()
+    try:
+        for page in doc:
+            # no page fonts and no annotations/form fields (which carry their own fonts): nothing to
+            # extract, e.g. scans and images, so skip the content parse
+            if not doc.get_page_fonts(page.number) and not page.first_annot and not page.first_widget:
+                continue
+            buf.write(page.get_text("text"))
+            buf.write("\n")
+    finally:
+        doc.close()
+    return buf.getvalue().strip()
+
+
 @app.post("/upload_resume")
 async def upload_resume(file: UploadFile = File(...)):
     logger.info(f"Upload attempt: filename={file.filename}, content_type={file.content_type}")
@@ -81,17 +116,7 @@ async def upload_resume(file: UploadFile = File(...)):
         return json_response(False, f"PDF exceeds {MAX_PDF_SIZE_MB} MB")
 
     try:
-        reader = PyPDF2.PdfReader(BytesIO(file_bytes))
-        text_parts: List[str] = []
-        for page in reader.pages:
-            extracted = ""
-            try:
-                extracted = page.extract_text() or ""
-            except Exception:
-                pass
-            if extracted:
-                text_parts.append(extracted)
-        resume_text = "\n".join(text_parts).strip()
+        resume_text = await asyncio.get_running_loop().run_in_executor(_PDF_EXECUTOR, _extract_pdf_text, file_bytes)
         if not resume_text:
             logger.warning("No text extracted from PDF")
             return json_response(False, "Could not extract text from PDF. Please upload a text-based PDF.")
@@ -107,7 +132,7 @@ async def upload_resume(file: UploadFile = File(...)):
 async def analyze(req: AnalyzeRequest):
     logger.info(f"Analysis request: resume_length={len(req.resume)}, job_desc_length={len(req.job_desc)}")
     try:
-        result = analyze_resume(req.resume, req.job_desc)
+        result = analyze_resume(req.resume, req.job_desc, content_hash(req.resume), content_hash(req.job_desc))
         logger.info(f"Analysis complete: match_percent={result.get('match_percent', 0)}")
         return json_response(True, "Analysis complete", result)
     except Exception as exc:
@@ -115,6 +140,18 @@ async def analyze(req: AnalyzeRequest):
         return json_response(False, f"Analysis failed: {exc}")
 
 
+@app.post("/analyze_batch")
+async def analyze_batch(req: AnalyzeBatchRequest):
+    logger.info(f"Batch analysis request: resumes={len(req.resumes)}, job_desc_length={len(req.job_desc)}")
+    try:
+        # CPU-bound for large batches: keep the event loop free for interactive requests
+        results = await asyncio.get_running_loop().run_in_executor(None, analyze_resumes, req.resumes, req.job_desc)
+        return json_response(True, "Analysis complete", {"results": results})
+    except Exception as exc:
+        logger.error(f"Batch analysis failed: {exc}")
+        return json_response(False, f"Analysis failed: {exc}")
+
+
 @app.post("/suggest")
 async def suggest(req: SuggestRequest):
     path = suggest_growth_path(req.resume)
@@ -139,11 +176,13 @@ async def download_pdf(req: DownloadPDFRequest, format: Literal["pdf", "docx", "
         file_bytes, media_type, filename = generate_resume_bytes(req.resume, format)
     except Exception as exc:
         return json_response(False, f"Failed to generate file: {exc}")
-    return StreamingResponse(
-        BytesIO(file_bytes),
+    # Files are small and fully built in memory: send them in one body, not chunked
+    return Response(
+        content=file_bytes,
         media_type=media_type,
         headers={
-            "Content-Disposition": f'attachment; filename="{filename}"'
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(len(file_bytes)),
         },
     )
 
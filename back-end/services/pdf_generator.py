@@ -1,23 +1,44 @@
 from __future__ import annotations
 
-from typing import Union, Tuple
+from typing import Tuple
 from io import BytesIO
 from fpdf import FPDF
 
-try:
-    from docx import Document  # optional
-    _DOCX_AVAILABLE = True
-except Exception:
-    _DOCX_AVAILABLE = False
-
 
 def _to_latin1(text: str) -> str:
     # FPDF core font supports latin-1; replace unsupported glyphs
+    if text.isascii():
+        # O(1) flag check; most resumes need no copy at all
+        return text
     return text.encode("latin-1", "replace").decode("latin-1")
 
 
+class _BytesFPDF(FPDF):
+    """FPDF that accumulates the finished document in a bytearray.
+
+    Stock FPDF builds its output with repeated str concatenation and the
+    caller then encodes that str again; this writes latin-1 bytes once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buffer = bytearray()
+
+    def _out(self, s):
+        if self.state == 2:
+            # page content, kept as str by FPDF until the page is serialized
+            super()._out(s)
+            return
+        if isinstance(s, str):
+            s = s.encode("latin-1")
+        elif not isinstance(s, (bytes, bytearray)):
+            s = str(s).encode("latin-1")
+        self.buffer += s
+        self.buffer += b"\n"
+
+
 def generate_resume_pdf(resume_text: str) -> bytes:
-    pdf = FPDF()
+    pdf = _BytesFPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
 
@@ -31,22 +52,20 @@ def generate_resume_pdf(resume_text: str) -> bytes:
         pdf.multi_cell(0, 6, paragraph)
         pdf.ln(1)
 
-    # Output as bytes
-    pdf_bytes: Union[bytes, bytearray, str] = pdf.output(dest="S").encode("latin-1")
-    if isinstance(pdf_bytes, str):
-        pdf_bytes = pdf_bytes.encode("latin-1", "replace")
-    return bytes(pdf_bytes)
+    return bytes(pdf.output(dest="S"))
 
 
 def generate_resume_bytes(resume_text: str, fmt: str) -> Tuple[bytes, str, str]:
     fmt = (fmt or "pdf").lower()
+    if fmt == "txt":
+        return (resume_text or "").encode("utf-8"), "text/plain; charset=utf-8", "resume.txt"
     if fmt == "pdf":
         pdf_bytes = generate_resume_pdf(resume_text)
         return pdf_bytes, "application/pdf", "resume.pdf"
-    if fmt == "txt":
-        return (resume_text or "").encode("utf-8"), "text/plain; charset=utf-8", "resume.txt"
     if fmt == "docx":
-        if not _DOCX_AVAILABLE:
+        try:
+            from docx import Document  # optional; imported on first use to keep startup light
+        except ImportError:
             raise RuntimeError("DOCX export requires python-docx. Please install it.")
         doc = Document()
         doc.add_heading("Resume", level=1)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import main and services the same way uvicorn does, from back-end/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+
+import pytest
+
+from services import analyzer
+from services.analyzer import (
+    analyze_resume,
+    analyze_resumes,
+    content_hash,
+    generate_cover_letter_text,
+    suggest_growth_path,
+)
+
+# Texts reach the analyzer without a digest here, so _skills() hashes them itself
+SURROGATE_RESUME = "python docker \ud800"
+SURROGATE_JOB = "python kubernetes \udfff"
+
+
+def test_direct_calls_hash_lone_surrogates():
+    assert analyze_resume(SURROGATE_RESUME, SURROGATE_JOB)["missing_skills"] == ["kubernetes"]
+    assert suggest_growth_path(SURROGATE_RESUME)["growth_path"]
+    assert "python" in generate_cover_letter_text(SURROGATE_RESUME, SURROGATE_JOB)
+
+
+def test_batch_hashes_lone_surrogates():
+    results = analyze_resumes([SURROGATE_RESUME, "flask \ud800"], SURROGATE_JOB)
+    assert [r["missing_skills"] for r in results] == [["kubernetes"], ["kubernetes", "python"]]
+
+
+@pytest.fixture
+def empty_caches(monkeypatch):
+    monkeypatch.setattr(analyzer, "_SKILL_CACHE", OrderedDict())
+    monkeypatch.setattr(analyzer, "_ANALYSIS_CACHE", OrderedDict())
+
+
+@pytest.fixture
+def extract_calls(monkeypatch, empty_caches):
+    calls = []
+    real = analyzer._extract_skills
+
+    def counting(text):
+        calls.append(text)
+        return real(text)
+
+    monkeypatch.setattr(analyzer, "_extract_skills", counting)
+    return calls
+
+
+def test_analysis_cache_hit_returns_same_result(empty_caches):
+    resume, job = "python docker", "python kubernetes"
+    first = analyze_resume(resume, job, content_hash(resume), content_hash(job))
+    second = analyze_resume(resume, job, content_hash(resume), content_hash(job))
+    assert second is first
+    assert len(analyzer._ANALYSIS_CACHE) == 1
+
+
+def test_skill_cache_evicts_least_recently_used(monkeypatch, extract_calls):
+    monkeypatch.setattr(analyzer, "_CACHE_SIZE", 3)
+    for text in ("python", "docker", "redis"):
+        analyzer._skills(text)
+    analyzer._skills("python")  # refresh, so "docker" is now the oldest
+    analyzer._skills("kubernetes")
+    assert list(analyzer._SKILL_CACHE) == [content_hash(t) for t in ("redis", "python", "kubernetes")]
+
+    extract_calls.clear()
+    analyzer._skills("python")
+    analyzer._skills("docker")
+    assert extract_calls == ["docker"]
+
+
+def test_skill_cache_counts_empty_mask_as_hit(extract_calls):
+    assert analyzer._skills("no known skills here") == 0
+    assert analyzer._skills("no known skills here") == 0
+    assert extract_calls == ["no known skills here"]
+
+
+def test_missing_skills_are_sorted():
+    job = "We need redis, kubernetes, aws, python, celery and django"
+    result = analyze_resume("python developer", job)
+    assert result["missing_skills"] == ["aws", "celery", "django", "kubernetes", "redis"]
+    assert result["match_percent"] == round(100.0 / 6, 1)
+
+
+def test_multi_word_skills_decode_from_mask():
+    mask = analyzer._extract_skills("Machine learning pipelines on GitHub Actions with unit testing")
+    assert analyzer._skill_names(mask) == ["github actions", "machine learning", "unit testing"]
+
+    result = analyze_resume("python", "python, machine learning, github actions, data science")
+    assert result["missing_skills"] == ["data science", "github actions", "machine learning"]
+
+
+def test_cover_letter_lists_overlap_in_sorted_order():
+    letter = generate_cover_letter_text(
+        "redis, machine learning, docker, aws",
+        "aws docker machine learning redis kubernetes",
+    )
+    assert "including aws, docker, machine learning, redis." in letter
@@ -0,0 +1,55 @@
+from fastapi.testclient import TestClient
+
+from main import MAX_BATCH_RESUMES, app
+from services import analyzer
+from services.analyzer import content_hash
+
+client = TestClient(app)
+
+# Lone surrogates are valid JSON string escapes and pass through pydantic unchanged
+SURROGATE_RESUME = '{"resume": "python docker \\ud800", "job_desc": "python kubernetes"}'
+
+
+def _post_raw(path: str, body: str):
+    return client.post(path, content=body, headers={"Content-Type": "application/json"})
+
+
+def test_content_hash_accepts_lone_surrogates():
+    assert content_hash("python \ud800") != content_hash("python \udfff")
+    assert content_hash("python \ud800") != content_hash("python ")
+
+
+def test_analyze_with_lone_surrogate():
+    resp = _post_raw("/analyze", SURROGATE_RESUME)
+    assert resp.status_code == 200
+    assert resp.json()["data"]["missing_skills"] == ["kubernetes"]
+
+
+def test_suggest_with_lone_surrogate():
+    resp = _post_raw("/suggest", SURROGATE_RESUME)
+    assert resp.status_code == 200
+    assert resp.json()["data"]["growth_path"]
+
+
+def test_cover_letter_with_lone_surrogate():
+    resp = _post_raw("/generate_cover_letter", SURROGATE_RESUME)
+    assert resp.status_code == 200
+    assert "python" in resp.json()["data"]["cover_letter"]
+
+
+def test_analyze_batch_scores_each_resume():
+    resp = client.post("/analyze_batch", json={"resumes": ["python kubernetes", "flask", ""], "job_desc": "python kubernetes"})
+    assert resp.status_code == 200
+    results = resp.json()["data"]["results"]
+    assert [r["match_percent"] for r in results] == [100.0, 0.0, 0.0]
+
+
+def test_analyze_batch_rejects_oversized_batch():
+    resp = client.post("/analyze_batch", json={"resumes": ["python"] * (MAX_BATCH_RESUMES + 1), "job_desc": "python"})
+    assert resp.status_code == 422
+
+
+def test_analyze_batch_leaves_skill_cache_alone():
+    before = dict(analyzer._SKILL_CACHE)
+    client.post("/analyze_batch", json={"resumes": [f"python {i}" for i in range(50)], "job_desc": "python docker"})
+    assert dict(analyzer._SKILL_CACHE) == before
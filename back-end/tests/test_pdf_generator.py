@@ -0,0 +1,43 @@
+import pymupdf
+
+from services.pdf_generator import generate_resume_pdf
+
+
+def _open(pdf_bytes: bytes):
+    doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
+    # PyMuPDF silently repairs broken xref tables; _BytesFPDF must write correct offsets
+    assert not doc.is_repaired
+    return doc
+
+
+def test_generated_pdf_round_trips_text():
+    doc = _open(generate_resume_pdf("Python developer\n\nDocker and AWS"))
+    try:
+        assert doc.page_count == 1
+        text = doc[0].get_text("text")
+    finally:
+        doc.close()
+    assert "Resume" in text
+    assert "Python developer" in text
+    assert "Docker and AWS" in text
+
+
+def test_generated_pdf_replaces_non_latin1_glyphs():
+    doc = _open(generate_resume_pdf("Café costs 5€"))
+    try:
+        text = doc[0].get_text("text")
+    finally:
+        doc.close()
+    assert "Café costs 5?" in text
+
+
+def test_long_resume_spans_pages():
+    paragraphs = [f"Paragraph {i}: built reliable Python services." for i in range(300)]
+    doc = _open(generate_resume_pdf("\n\n".join(paragraphs)))
+    try:
+        assert doc.page_count > 1
+        text = "".join(page.get_text("text") for page in doc)
+    finally:
+        doc.close()
+    assert "Paragraph 0:" in text
+    assert "Paragraph 299:" in text
@@ -0,0 +1,20 @@
+from services.analyzer import analyze_resume
+
+
+def test_multi_word_and_slashed_skills_match():
+    result = analyze_resume("GitHub Actions, CI/CD and machine learning", "github actions ci/cd machine learning")
+    assert result["match_percent"] == 100.0
+    assert result["missing_skills"] == []
+
+
+def test_non_ascii_delimiters_split_words():
+    # ’ — • and é are common in PDF-extracted text and must not glue skills to neighbours
+    result = analyze_resume("python’s docker—flask • café", "python, flask")
+    assert result["match_percent"] == 100.0
+    assert result["missing_skills"] == []
+
+
+def test_skills_are_whole_words():
+    result = analyze_resume("pythonic restful awsome", "python rest aws")
+    assert result["match_percent"] == 0.0
+    assert result["missing_skills"] == ["aws", "python", "rest"]
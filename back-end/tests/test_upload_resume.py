@@ -0,0 +1,54 @@
+import pymupdf
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def _upload(pdf_bytes: bytes):
+    return client.post("/upload_resume", files={"file": ("resume.pdf", pdf_bytes, "application/pdf")})
+
+
+def _pdf(build) -> bytes:
+    doc = pymupdf.open()
+    page = doc.new_page()
+    build(page)
+    data = doc.tobytes(deflate=True)
+    doc.close()
+    return data
+
+
+def test_extracts_page_text():
+    resp = _upload(_pdf(lambda page: page.insert_text((72, 72), "Python developer, docker, aws")))
+    assert resp.status_code == 200
+    assert "Python developer, docker, aws" in resp.json()["data"]["resume_text"]
+
+
+def test_extracts_form_field_text():
+    def build(page):
+        widget = pymupdf.Widget()
+        widget.field_type = pymupdf.PDF_WIDGET_TYPE_TEXT
+        widget.field_name = "summary"
+        widget.field_value = "Python developer, docker, aws"
+        widget.rect = pymupdf.Rect(72, 72, 400, 100)
+        page.add_widget(widget)
+
+    resp = _upload(_pdf(build))
+    assert resp.status_code == 200
+    assert "Python developer, docker, aws" in resp.json()["data"]["resume_text"]
+
+
+def test_extracts_freetext_annotation_text():
+    def build(page):
+        page.add_freetext_annot(pymupdf.Rect(72, 72, 400, 100), "Python developer, docker, aws")
+
+    resp = _upload(_pdf(build))
+    assert resp.status_code == 200
+    assert "Python developer, docker, aws" in resp.json()["data"]["resume_text"]
+
+
+def test_image_only_pdf_is_rejected():
+    resp = _upload(_pdf(lambda page: None))
+    assert resp.status_code == 400
+    assert "Could not extract text" in resp.json()["message"]